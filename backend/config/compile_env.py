@@ -0,0 +1,43 @@
+"""
+Compile .env into a generated Python module for zero-cost import.
+
+Run at deploy/build time:
+
+    python -m config.compile_env
+
+Writes config/_env_cache.py containing the parsed .env values as literals.
+Once written, the interpreter's .pyc cache serves the values on subsequent
+starts with no disk parse at all; settings.py falls back to the regular
+dotenv path when the generated module is missing or stale.
+"""
+
+from pathlib import Path
+
+from dotenv import dotenv_values
+
+_HEADER = '''"""Generated by `python -m config.compile_env` - do not edit or commit."""
+
+ENV_MTIME_NS = {mtime}
+ENV = {values!r}
+'''
+
+
+def compile_env(env_path: Path | None = None) -> Path | None:
+    """Parse .env and write config/_env_cache.py. Returns the output path."""
+    if env_path is None:
+        env_path = Path(__file__).parent.parent / ".env"
+    try:
+        mtime = env_path.stat().st_mtime_ns
+    except OSError:
+        print(f"No .env found at {env_path}; nothing to compile.")
+        return None
+
+    values = {k: v for k, v in dotenv_values(dotenv_path=env_path).items() if v is not None}
+    out_path = Path(__file__).parent / "_env_cache.py"
+    out_path.write_text(_HEADER.format(mtime=mtime, values=values), encoding="utf-8")
+    print(f"Compiled {len(values)} values from {env_path} -> {out_path}")
+    return out_path
+
+
+if __name__ == "__main__":
+    compile_env()
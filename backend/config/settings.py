@@ -3,74 +3,208 @@ Configuration management using environment variables.
 """
 
 import os
+import pickle
+from dataclasses import dataclass
 from pathlib import Path
-from dotenv import load_dotenv
+from dotenv import dotenv_values
 
-# Load .env file from project root
+
+def _load_env_cached(path: Path) -> None:
+    """
+    Load .env values into os.environ, caching the parsed result.
+
+    dotenv parsing costs tens of ms per interpreter start; since settings is
+    imported by every CLI/test subprocess, the parsed dict is pickled next to
+    the .env file keyed on its mtime, so repeat starts skip the parser.
+    Matches load_dotenv semantics: existing environment variables win.
+    """
+    try:
+        mtime = path.stat().st_mtime_ns
+    except OSError:
+        return  # No .env file - nothing to load
+
+    cache_path = path.with_suffix(path.suffix + ".cache.pkl")
+    values = None
+    try:
+        with open(cache_path, "rb") as f:
+            cached_mtime, cached_values = pickle.load(f)
+        if cached_mtime == mtime:
+            values = cached_values
+    except (OSError, pickle.PickleError, ValueError, EOFError):
+        pass
+
+    if values is None:
+        values = {k: v for k, v in dotenv_values(dotenv_path=path).items() if v is not None}
+        try:
+            with open(cache_path, "wb") as f:
+                pickle.dump((mtime, values), f)
+        except OSError:
+            pass  # Cache write is best-effort
+
+    for key, value in values.items():
+        os.environ.setdefault(key, value)
+
+
+def _load_env_compiled(path: Path) -> bool:
+    """
+    Load env values from the generated _env_cache.py module if it is fresh.
+
+    `python -m config.compile_env` transpiles .env into Python literals at
+    deploy time, so the interpreter's .pyc cache serves them with zero parse
+    cost. Returns True when applied; False means fall back to _load_env_cached.
+    """
+    try:
+        from . import _env_cache
+    except ImportError:
+        return False
+
+    try:
+        mtime = path.stat().st_mtime_ns
+    except OSError:
+        mtime = None
+
+    if mtime is not None and _env_cache.ENV_MTIME_NS != mtime:
+        return False  # .env changed since compile - stale
+
+    for key, value in _env_cache.ENV.items():
+        os.environ.setdefault(key, value)
+    return True
+
+
+# Load .env file from project root (compiled module first, pickle cache second)
 env_path = Path(__file__).parent.parent / ".env"
-load_dotenv(dotenv_path=env_path)
+if not _load_env_compiled(env_path):
+    _load_env_cached(env_path)
+
+# Truthy values accepted for boolean env vars (tolerant of common CI spellings)
+_TRUE_SET = frozenset(("true", "1", "yes", "y", "on"))
+
+
+def _env_flag(name: str) -> bool:
+    """Parse a boolean environment variable without per-call allocations."""
+    return os.getenv(name, "").strip().lower() in _TRUE_SET
+
+
+def _env_int(name: str, default: int) -> int:
+    """Parse an integer environment variable, falling back to the default
+    instead of crashing the import on a malformed value."""
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        return default
 
 
+@dataclass(frozen=True, slots=True)
 class Settings:
-    """Application settings loaded from environment variables."""
-    
+    """Application settings loaded once from environment variables."""
+
     # OpenAI
-    OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
-    OPENAI_MODEL: str = os.getenv("OPENAI_MODEL", "gpt-4-turbo-preview")
-    
+    OPENAI_API_KEY: str
+    OPENAI_MODEL: str
+
     # Anthropic (Claude)
-    ANTHROPIC_API_KEY: str = os.getenv("ANTHROPIC_API_KEY", "")
-    
+    ANTHROPIC_API_KEY: str
+
     # Groq (fast, free API)
-    GROQ_API_KEY: str = os.getenv("GROQ_API_KEY", "")
-    GROQ_MODEL: str = os.getenv("GROQ_MODEL", "llama3-8b-8192")
-    
+    GROQ_API_KEY: str
+    GROQ_MODEL: str
+
     # Ollama (local, free LLM)
-    OLLAMA_ENABLED: bool = os.getenv("OLLAMA_ENABLED", "false").lower() == "true"
-    OLLAMA_MODEL: str = os.getenv("OLLAMA_MODEL", "llama3.2")
-    OLLAMA_BASE_URL: str = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
+    OLLAMA_ENABLED: bool
+    OLLAMA_MODEL: str
+    OLLAMA_BASE_URL: str
 
     # Aviation Weather API
-    AVWX_API_KEY: str = os.getenv("AVWX_API_KEY", "")
-    
+    AVWX_API_KEY: str
+
     # Database
-    DATABASE_URL: str = os.getenv("DATABASE_URL", "")
-    PGVECTOR_ENABLED: bool = os.getenv("PGVECTOR_ENABLED", "false").lower() == "true"
-    
+    DATABASE_URL: str
+    PGVECTOR_ENABLED: bool
+
+    # Redis (LLM response cache shared across workers; empty = in-process)
+    REDIS_URL: str
+
     # API Server
-    API_HOST: str = os.getenv("API_HOST", "0.0.0.0")
-    API_PORT: int = int(os.getenv("API_PORT", "8000"))
-    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
-    
+    API_HOST: str
+    API_PORT: int
+    LOG_LEVEL: str
+
     # Agent
-    MAX_AGENT_LOOPS: int = int(os.getenv("MAX_AGENT_LOOPS", "5"))
-    AGENT_TIMEOUT_SECONDS: int = int(os.getenv("AGENT_TIMEOUT_SECONDS", "30"))
-    
-    @property
-    def has_openai_key(self) -> bool:
-        """Check if OpenAI API key is configured."""
-        return bool(self.OPENAI_API_KEY and self.OPENAI_API_KEY != "")
-    
-    @property
-    def has_anthropic_key(self) -> bool:
-        """Check if Anthropic API key is configured."""
-        return bool(self.ANTHROPIC_API_KEY and self.ANTHROPIC_API_KEY != "")
-    
-    @property
-    def has_groq_key(self) -> bool:
-        """Check if Groq API key is configured."""
-        return bool(self.GROQ_API_KEY and self.GROQ_API_KEY != "")
-    
-    @property
-    def has_ollama(self) -> bool:
-        """Check if Ollama is enabled for local LLM."""
-        return self.OLLAMA_ENABLED
-
-    @property
-    def has_weather_api(self) -> bool:
-        """Check if aviation weather API is configured."""
-        return bool(self.AVWX_API_KEY and self.AVWX_API_KEY != "")
-
-
-# Global settings instance
-settings = Settings()
+    MAX_AGENT_LOOPS: int
+    AGENT_TIMEOUT_SECONDS: int
+
+    # Reusable agents kept in the API pool (also caps concurrent agent runs)
+    AGENT_POOL_SIZE: int
+
+    # METAR cache (seconds; METARs refresh roughly hourly, 0 disables)
+    METAR_CACHE_TTL: int
+
+    # Per-tool-call timeout in async paths (milliseconds, 0 disables)
+    MAX_TOOL_LATENCY_MS: int
+
+    # LLM rate limiting: max in-flight provider calls, and requests/minute
+    # budget (0 disables the RPM bucket)
+    LLM_MAX_CONCURRENCY: int
+    LLM_RPM: int
+
+    # Guardrail scheduling in async paths: "concurrent" runs verification in
+    # a worker thread so the event loop stays free; "sequential" keeps it
+    # inline on the request path (simpler to reason about when debugging)
+    GUARDRAIL_MODE: str
+
+    # Capability flags, precomputed once in from_env(). These replaced the
+    # former has_* @property methods: cached_property would need __dict__
+    # (incompatible with slots=True), so plain bool fields are used instead -
+    # hot-path checks are a single attribute load with no re-evaluation.
+    has_openai_key: bool
+    has_anthropic_key: bool
+    has_groq_key: bool
+    has_ollama: bool
+    has_weather_api: bool
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """Read each environment variable once and build an immutable instance."""
+        openai_api_key = os.getenv("OPENAI_API_KEY", "")
+        anthropic_api_key = os.getenv("ANTHROPIC_API_KEY", "")
+        groq_api_key = os.getenv("GROQ_API_KEY", "")
+        ollama_enabled = _env_flag("OLLAMA_ENABLED")
+        avwx_api_key = os.getenv("AVWX_API_KEY", "")
+
+        return cls(
+            OPENAI_API_KEY=openai_api_key,
+            OPENAI_MODEL=os.getenv("OPENAI_MODEL", "gpt-4-turbo-preview"),
+            ANTHROPIC_API_KEY=anthropic_api_key,
+            GROQ_API_KEY=groq_api_key,
+            GROQ_MODEL=os.getenv("GROQ_MODEL", "llama3-8b-8192"),
+            OLLAMA_ENABLED=ollama_enabled,
+            OLLAMA_MODEL=os.getenv("OLLAMA_MODEL", "llama3.2"),
+            OLLAMA_BASE_URL=os.getenv("OLLAMA_BASE_URL", "http://localhost:11434"),
+            AVWX_API_KEY=avwx_api_key,
+            DATABASE_URL=os.getenv("DATABASE_URL", ""),
+            PGVECTOR_ENABLED=_env_flag("PGVECTOR_ENABLED"),
+            REDIS_URL=os.getenv("REDIS_URL", ""),
+            API_HOST=os.getenv("API_HOST", "0.0.0.0"),
+            API_PORT=_env_int("API_PORT", 8000),
+            LOG_LEVEL=os.getenv("LOG_LEVEL", "INFO"),
+            MAX_AGENT_LOOPS=_env_int("MAX_AGENT_LOOPS", 5),
+            AGENT_TIMEOUT_SECONDS=_env_int("AGENT_TIMEOUT_SECONDS", 30),
+            AGENT_POOL_SIZE=_env_int("AGENT_POOL_SIZE", 8),
+            METAR_CACHE_TTL=_env_int("METAR_CACHE_TTL", 600),
+            MAX_TOOL_LATENCY_MS=_env_int("MAX_TOOL_LATENCY_MS", 10_000),
+            LLM_MAX_CONCURRENCY=_env_int("LLM_MAX_CONCURRENCY", 8),
+            LLM_RPM=_env_int("LLM_RPM", 0),
+            GUARDRAIL_MODE=os.getenv("GUARDRAIL_MODE", "concurrent").strip().lower(),
+            has_openai_key=bool(openai_api_key),
+            has_anthropic_key=bool(anthropic_api_key),
+            has_groq_key=bool(groq_api_key),
+            has_ollama=ollama_enabled,
+            has_weather_api=bool(avwx_api_key),
+        )
+
+
+# Global settings instance (built once at import)
+settings = Settings.from_env()
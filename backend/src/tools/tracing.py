@@ -12,11 +12,59 @@ Tracked items:
 
 from __future__ import annotations
 
+import atexit
 import json
 import os
+import threading
 import time
 import uuid
-from typing import Any, Dict, List, Optional
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+
+# Optional orjson: C-implemented serializer, several times faster than
+# stdlib json on the nested trace dicts. Falls back to json.dumps.
+try:
+    import orjson
+
+    def _dumps_line(obj: Any) -> str:
+        return orjson.dumps(obj).decode("utf-8") + "\n"
+except ImportError:
+    def _dumps_line(obj: Any) -> str:
+        return json.dumps(obj) + "\n"
+
+
+# Pending NDJSON lines per trace file. Emits append here and flush in
+# batches, so a high-throughput agent run pays one open/write/close per
+# _FLUSH_EVERY traces instead of per trace; atexit drains the remainder.
+_FLUSH_EVERY = 100
+_PENDING: Dict[str, List[str]] = {}
+_PENDING_LOCK = threading.Lock()
+_DIRS_MADE: set = set()
+
+
+def _flush(path: Optional[str] = None) -> None:
+    """Write buffered trace lines for one path (or all paths) to disk."""
+    with _PENDING_LOCK:
+        if path is not None:
+            drained = [(path, _PENDING.pop(path, []))]
+        else:
+            drained = [(p, _PENDING.pop(p)) for p in list(_PENDING)]
+    for p, lines in drained:
+        if not lines:
+            continue
+        parent = os.path.dirname(p)
+        if parent and parent not in _DIRS_MADE:
+            os.makedirs(parent, exist_ok=True)
+            _DIRS_MADE.add(parent)
+        with open(p, "a", encoding="utf-8") as f:
+            f.writelines(lines)
+
+
+atexit.register(_flush)
+
+# Per-trace event cap for the ring buffer
+_EVENTS_MAX = 10_000
 
 
 class TraceLogger:
@@ -25,10 +73,23 @@ class TraceLogger:
     """
 
     def __init__(self, category: str = "crosswind"):
+        # Bounded ring buffer: a long-running trace can't bloat memory
+        # before it is emitted
+        self.events: Deque[Dict[str, Any]] = deque(maxlen=_EVENTS_MAX)
+        self.context: Dict[str, Any] = {}
+        self.reset(category)
+
+    def reset(self, category: str = "crosswind") -> None:
+        """Re-arm this logger for a fresh trace (pooled reuse)."""
         self.category = category
         self.trace_id = f"{int(time.time() * 1000)}-{uuid.uuid4().hex[:8]}"
-        self.events: List[Dict[str, Any]] = []
-        self.context: Dict[str, Any] = {}
+        self.events.clear()
+        self.context.clear()
+        # Wall clock captured once for absolute reference; per-event
+        # timestamps are integer monotonic deltas from this origin
+        # (one vDSO call, no float math, immune to clock steps)
+        self.t_start_wall = time.time()
+        self._t0_ns = time.monotonic_ns()
 
     def set_context(self, **kwargs) -> None:
         self.context.update(kwargs)
@@ -38,7 +99,7 @@ class TraceLogger:
             "type": "input",
             "raw_metar": raw_metar,
             "wind_str": wind_str,
-            "ts": time.time(),
+            "t_ns": time.monotonic_ns() - self._t0_ns,
         })
 
     def log_transformation(self, wind_direction: Optional[float], wind_speed: Optional[float]) -> None:
@@ -46,7 +107,7 @@ class TraceLogger:
             "type": "transformation",
             "wind_direction_deg": wind_direction,
             "wind_speed_kt": wind_speed,
-            "ts": time.time(),
+            "t_ns": time.monotonic_ns() - self._t0_ns,
         })
 
     def log_operation(self, function: str, angle_deg: Optional[float], expression: Optional[str]) -> None:
@@ -55,7 +116,7 @@ class TraceLogger:
             "function": function,
             "angle_deg": angle_deg,
             "expression": expression,
-            "ts": time.time(),
+            "t_ns": time.monotonic_ns() - self._t0_ns,
         })
 
     def log_result(self, crosswind_kt: Optional[float], headwind_kt: Optional[float]) -> None:
@@ -63,21 +124,52 @@ class TraceLogger:
             "type": "result",
             "crosswind_kt": crosswind_kt,
             "headwind_kt": headwind_kt,
-            "ts": time.time(),
+            "t_ns": time.monotonic_ns() - self._t0_ns,
         })
 
     def to_json(self) -> Dict[str, Any]:
         return {
             "trace_id": self.trace_id,
             "category": self.category,
-            "context": self.context,
-            "events": self.events,
+            "t_start_wall": self.t_start_wall,
+            "context": dict(self.context),
+            "events": list(self.events),
         }
 
-    def emit(self, path: str = "logs/trace.jsonl") -> None:
-        os.makedirs(os.path.dirname(path), exist_ok=True)
-        with open(path, "a", encoding="utf-8") as f:
-            f.write(json.dumps(self.to_json()) + "\n")
+    def emit(self, path: str = "logs/trace.jsonl", flush: bool = False) -> None:
+        """Queue this trace for writing; batches hit disk every
+        _FLUSH_EVERY traces or at interpreter exit.
+
+        Pass flush=True for traces that must be durable immediately
+        (e.g. safety audit records).
+        """
+        line = _dumps_line(self.to_json())
+        with _PENDING_LOCK:
+            pending = _PENDING.setdefault(path, [])
+            pending.append(line)
+            flush = flush or len(pending) >= _FLUSH_EVERY
+        if flush:
+            _flush(path)
+
+
+_THREAD_LOGGERS = threading.local()
+
+
+def acquire_logger(category: str = "crosswind") -> TraceLogger:
+    """Reusable per-thread TraceLogger.
+
+    Hot paths that trace per request skip re-allocating the event buffer
+    and context dict each time; the logger is reset (fresh trace_id and
+    time origin) on every acquisition. Callers must finish with the
+    returned logger before acquiring again on the same thread.
+    """
+    logger = getattr(_THREAD_LOGGERS, "logger", None)
+    if logger is None:
+        logger = TraceLogger(category)
+        _THREAD_LOGGERS.logger = logger
+    else:
+        logger.reset(category)
+    return logger
 
 
 if __name__ == "__main__":
@@ -88,5 +180,5 @@ if __name__ == "__main__":
     tracer.log_transformation(wind_direction=220.0, wind_speed=10.0)
     tracer.log_operation(function="sin", angle_deg=50.0, expression="10 × sin(50°)")
     tracer.log_result(crosswind_kt=7.66, headwind_kt=6.43)
-    tracer.emit()
+    tracer.emit(flush=True)
     print("Trace emitted to logs/trace.jsonl")
@@ -8,20 +8,56 @@ Tests the full agent pipeline including:
 - Safe-fail path
 """
 
+import copy
+import json
+import os
+
 import pytest
-from unittest.mock import Mock, patch, MagicMock
 from src.agent.agent import FlightAssistantAgent
 
+# The safe-fail audit test checks logs/trace.jsonl; create the directory
+# once at collection instead of relying on the writer
+os.makedirs("logs", exist_ok=True)
+
+
+@pytest.fixture(scope="session")
+def pristine_agent():
+    """Construct the agent once per session; tests get cheap copies."""
+    agent = FlightAssistantAgent()
+    agent.use_real_llm = False  # Force simulated loop
+    return agent
+
+
+def _fresh_agent(pristine: FlightAssistantAgent) -> FlightAssistantAgent:
+    """Shallow-copy the pristine agent and give it fresh mutable state,
+    so each test starts from the same invariant as a new construction
+    without re-paying __init__."""
+    agent = copy.copy(pristine)
+    agent.loop_count = 0
+    agent.metar_data = None
+    agent.runway_heading = None
+    agent._last_metar_result = None
+    agent._injected_wind = None
+    agent._truth_cache = {}
+    agent._tool_result_lines = []
+    return agent
+
+
+def _agent_with_data(pristine: FlightAssistantAgent, metar: dict) -> FlightAssistantAgent:
+    """Fresh agent pre-loaded with METAR and runway 260."""
+    agent = _fresh_agent(pristine)
+    agent.metar_data = metar
+    agent.runway_heading = 260
+    return agent
+
 
 class TestAgentGuardrailIntegration:
     """Test agent integration with guardrails"""
     
     @pytest.fixture
-    def agent(self):
+    def agent(self, pristine_agent):
         """Create agent with simulated loop (no real LLM)"""
-        agent = FlightAssistantAgent()
-        agent.use_real_llm = False  # Force simulated loop
-        return agent
+        return _fresh_agent(pristine_agent)
     
     @pytest.fixture
     def mock_metar_kden(self):
@@ -85,18 +121,25 @@ class TestAgentGuardrailIntegration:
 class TestAgentVerification:
     """Test agent response verification"""
     
-    @pytest.fixture
-    def agent_with_data(self):
-        """Agent with pre-loaded METAR and runway data"""
-        agent = FlightAssistantAgent()
-        agent.use_real_llm = False
-        agent.metar_data = {
-            "station": "KDEN",
-            "wind": "220 @ 10",
-            "wind_gust": None,
-        }
-        agent.runway_heading = 260
-        return agent
+    _METAR = {
+        "station": "KDEN",
+        "wind": "220 @ 10",
+        "wind_gust": None,
+    }
+    
+    @pytest.fixture(scope="class")
+    @classmethod
+    def agent_with_data(cls, pristine_agent):
+        """Agent with pre-loaded METAR and runway data, shared per class"""
+        return _agent_with_data(pristine_agent, dict(cls._METAR))
+    
+    @pytest.fixture(autouse=True)
+    def _restore_data(self, agent_with_data):
+        # Keep the class-scoped agent order-independent: restore the
+        # canonical METAR/runway after each test
+        yield
+        agent_with_data.metar_data = dict(self._METAR)
+        agent_with_data.runway_heading = 260
     
     def test_verify_response_passes_good_claim(self, agent_with_data):
         """Test verification passes with accurate crosswind claim"""
@@ -119,10 +162,23 @@ class TestAgentVerification:
         assert result["details"]["discrepancy"] > 3.0
         assert result["reflection_prompt"] is not None
     
-    def test_verify_response_skips_without_data(self):
+    def test_verify_response_handles_dict_wind(self, pristine_agent):
+        """Dict-shaped wind (fetch_metar_real format) degrades to the
+        parse-failure path instead of crashing on the truth-cache key"""
+        agent = _agent_with_data(pristine_agent, {
+            "station": "KDEN",
+            "wind": {"dir": 220, "speed_kt": 10, "gust_kt": None},
+            "wind_gust": None,
+        })
+        
+        result = agent.verify_response("The crosswind is 7.4 knots.")
+        
+        assert result["passed"] is False
+        assert "Could not parse wind data" in result["details"]["issue"]
+    
+    def test_verify_response_skips_without_data(self, pristine_agent):
         """Test verification is skipped when METAR/runway not available"""
-        agent = FlightAssistantAgent()
-        agent.use_real_llm = False
+        agent = _fresh_agent(pristine_agent)
         # No METAR or runway data set
         
         response = "Some response without crosswind data needed."
@@ -135,18 +191,23 @@ class TestAgentVerification:
 class TestAgentReflection:
     """Test agent reflection mechanism"""
     
-    @pytest.fixture
-    def agent_with_data(self):
-        agent = FlightAssistantAgent()
-        agent.use_real_llm = False
-        agent.metar_data = {
-            "station": "KDEN",
-            "raw": "METAR KDEN 180953Z 26013KT 10SM FEW200",
-            "wind": "220 @ 10",
-            "wind_gust": None,
-        }
-        agent.runway_heading = 260
-        return agent
+    _METAR = {
+        "station": "KDEN",
+        "raw": "METAR KDEN 180953Z 26013KT 10SM FEW200",
+        "wind": "220 @ 10",
+        "wind_gust": None,
+    }
+    
+    @pytest.fixture(scope="class")
+    @classmethod
+    def agent_with_data(cls, pristine_agent):
+        return _agent_with_data(pristine_agent, dict(cls._METAR))
+    
+    @pytest.fixture(autouse=True)
+    def _restore_data(self, agent_with_data):
+        yield
+        agent_with_data.metar_data = dict(self._METAR)
+        agent_with_data.runway_heading = 260
     
     def test_reflection_generates_corrected_response(self, agent_with_data):
         """Test that reflection generates a corrected response"""
@@ -174,17 +235,13 @@ class TestAgentSafeFail:
     """Test agent safe-fail path"""
     
     @pytest.fixture
-    def agent_with_data(self):
-        agent = FlightAssistantAgent()
-        agent.use_real_llm = False
-        agent.metar_data = {
+    def agent_with_data(self, pristine_agent):
+        return _agent_with_data(pristine_agent, {
             "station": "KDEN",
             "raw": "METAR KDEN 180953Z 26013KT 10SM",
             "wind": "220 @ 10",
             "wind_gust": None,
-        }
-        agent.runway_heading = 260
-        return agent
+        })
     
     def test_safe_fail_generates_fallback(self, agent_with_data):
         """Test safe-fail path generates conservative fallback"""
@@ -222,9 +279,12 @@ class TestAgentSafeFail:
         assert "independently" in fallback.lower()
         assert "AUDIT" in fallback
     
-    def test_safe_fail_logs_audit_trace(self, agent_with_data):
-        """Test that safe-fail logs to trace.jsonl"""
-        import os
+    def test_safe_fail_logs_audit_trace(self, agent_with_data, monkeypatch, tmp_path):
+        """Test that safe-fail writes an audit trace"""
+        # Redirect the audit trace to a per-test file: no dependence on the
+        # shared logs/ directory and no cross-worker stomping under xdist
+        trace_path = tmp_path / "trace.jsonl"
+        monkeypatch.setattr("src.agent.agent._TRACE_PATH", str(trace_path))
         
         original_failure = {
             "passed": False,
@@ -249,23 +309,20 @@ class TestAgentSafeFail:
         # Call safe-fail
         agent_with_data._safe_fail_response(original_failure, reflection_failure)
         
-        # Check that trace file exists
-        assert os.path.exists("logs/trace.jsonl")
+        # Audit record must be durable and carry the safe-fail event
+        record = json.loads(trace_path.read_text().splitlines()[-1])
+        assert record["category"] == "safe_fail"
+        assert record["context"]["original_claim"] == 20.0
+        assert any(e.get("function") == "safe_fail_triggered" for e in record["events"])
 
 
 class TestAgentFullPipeline:
     """Integration tests for full agent pipeline with guardrails"""
     
-    @pytest.fixture
-    def agent(self):
-        agent = FlightAssistantAgent()
-        agent.use_real_llm = False
-        return agent
-    
-    @patch('src.tools.tools.execute_tool')
-    def test_full_pipeline_with_verification(self, mock_execute_tool, agent):
+    @pytest.mark.slow
+    def test_full_pipeline_with_verification(self):
         """Test full agent run with tool calls and verification"""
-        # Mock tool responses
+        # Stub tool responses via constructor injection (no mock.patch)
         def tool_side_effect(tool_name, **kwargs):
             if tool_name == "fetch_metar":
                 return {
@@ -282,7 +339,8 @@ class TestAgentFullPipeline:
                 }
             return {}
         
-        mock_execute_tool.side_effect = tool_side_effect
+        agent = FlightAssistantAgent(execute_tool=tool_side_effect)
+        agent.use_real_llm = False
         
         # Run agent with query that triggers Denver->Boulder scenario
         result = agent.run("Is it safe to fly from Denver to Boulder in my Cessna?")
@@ -302,10 +360,8 @@ class TestAgentStreamingWithGuardrails:
     """Test streaming endpoint with guardrail events"""
     
     @pytest.fixture
-    def agent(self):
-        agent = FlightAssistantAgent()
-        agent.use_real_llm = False
-        return agent
+    def agent(self, pristine_agent):
+        return _fresh_agent(pristine_agent)
     
     def test_streaming_emits_guardrail_event(self, agent):
         """Test that streaming emits guardrail verification event"""